@@ -14,16 +14,33 @@ Public API:
     - check_compatibility(): Check version compatibility
     - AnalysisConfig: Configuration dataclass
     - AnalysisResult: Result dataclass with symbols and dependencies
+    - SymbolTable: Column-oriented view of a result's symbols
 """
 
+from functools import lru_cache, partial
+from itertools import chain
 from pathlib import Path
-from typing import Optional, List, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 import ast
+import hashlib
 import os
+import re
+import stat
 
 # Import configuration and result types
 from .config import AnalysisConfig
-from .result import AnalysisResult, Symbol, Dependency, SymbolKind
+from .result import AnalysisResult, Symbol, Dependency, SymbolKind, SymbolTable
+from . import _cache, _symbols
 
 # Version constants
 __version__ = "0.1.0"
@@ -43,19 +60,25 @@ except ImportError as e:
     ) from e
 
 
+# (path, symbols, warning, sha256 of a freshly parsed file) from one worker
+_ParseOutcome = Tuple[str, Sequence[Symbol], Optional[str], Optional[bytes]]
+
+
 def analyze(
-    source: Union[str, Path], config: Optional[AnalysisConfig] = None
+    source: Union[str, "os.PathLike[str]"], config: Optional[AnalysisConfig] = None
 ) -> AnalysisResult:
     """Analyze source code and extract symbols and dependencies.
 
     Args:
-        source: Path to file or directory to analyze
+        source: Path to file or directory to analyze (str or os.PathLike)
         config: Optional analysis configuration
 
     Returns:
         AnalysisResult containing symbols, dependencies, and metadata
 
     Raises:
+        TypeError: If source is not a str or os.PathLike
+        FileNotFoundError: If source path does not exist
         ValueError: If source path is invalid
         RuntimeError: If analysis fails
 
@@ -66,24 +89,25 @@ def analyze(
     if config is None:
         config = AnalysisConfig()
 
-    # Normalize source to Path
-    if isinstance(source, Path):
-        source_path = source
-    elif isinstance(source, str):
-        source_path = Path(source)
-    else:
+    # os.fspath() accepts str and any os.PathLike without building a Path
+    source_fs = os.fspath(source)
+    if not isinstance(source_fs, str):
         raise TypeError("source must be a str or Path")
 
-    # Basic existence check to produce clear errors for tests/clients
-    if not source_path.exists():
-        raise FileNotFoundError(f"Source path does not exist: {source_path}")
+    # One stat serves both the existence check and the file/dir dispatch
+    try:
+        source_stat = os.stat(source_fs)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"Source path does not exist: {source_fs}") from None
 
     # For now we implement analysis in Python using the stdlib AST module.
     # This keeps tests and clients working while the Rust engine is evolving.
-    return _analyze_python_source(source_path, config)
+    return _analyze_python_source(Path(source_fs), source_stat, config)
 
 
-def _analyze_python_source(source_path: Path, config: AnalysisConfig) -> AnalysisResult:
+def _analyze_python_source(
+    source_path: Path, source_stat: os.stat_result, config: AnalysisConfig
+) -> AnalysisResult:
     """Very simple Python-only analyzer used for tests and local dev.
 
     It walks .py files under the given path and extracts:
@@ -92,116 +116,301 @@ def _analyze_python_source(source_path: Path, config: AnalysisConfig) -> Analysi
     - methods
     - module-level variables
     """
-    python_files: List[Path] = []
-    if source_path.is_file():
+    result = AnalysisResult()
+
+    # (path, stat) of every file to analyze
+    python_files: List[Tuple[str, os.stat_result]] = []
+    if stat.S_ISREG(source_stat.st_mode):
         if source_path.suffix == ".py":
-            python_files.append(source_path)
-    elif source_path.is_dir():
-        for root, _dirs, files in os.walk(source_path):
-            for name in files:
-                if name.endswith(".py"):
-                    python_files.append(Path(root) / name)
+            if source_stat.st_size > config.max_file_size:
+                result.warnings.append(_too_large_warning(source_path))
+            else:
+                python_files.append((str(source_path), source_stat))
+    elif stat.S_ISDIR(source_stat.st_mode):
+        python_files = _discover_python_files(source_path, config, result.warnings)
     else:
         raise ValueError(f"Unsupported source path type: {source_path}")
 
-    result = AnalysisResult()
     result.file_count = len(python_files)
 
-    for file_path in python_files:
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                code = f.read()
-            tree = ast.parse(code, filename=str(file_path))
-        except SyntaxError as exc:
+    # Reuse symbols of files unchanged since an earlier call in this process
+    outcomes: List[_ParseOutcome] = []
+    pending: List[int] = []
+    for path_str, st in python_files:
+        recent = _cache.lookup_recent(path_str, st.st_mtime_ns, st.st_size)
+        if recent is None:
+            # Placeholder, replaced once the file has been parsed
+            pending.append(len(outcomes))
+            outcomes.append((path_str, [], None, None))
+        else:
+            outcomes.append((path_str, recent, None, None))
+
+    cache_conn = None
+    worker = _parse_file_worker
+    if config.cache_dir is not None:
+        cache_conn = _cache.open_cache(Path(config.cache_dir))
+        worker = partial(_parse_file_worker, hash_source=True)
+
+    try:
+        paths = [python_files[i][0] for i in pending]
+        known: Dict[str, bytes] = {}
+        digests: Optional[List[Optional[bytes]]] = None
+        if cache_conn is not None:
+            # Workers hash each file as they read it and skip parsing when the
+            # digest matches the cached one; the database itself is only used
+            # from this thread, on a connection that is closed below.
+            known = _cache.stored_digests(cache_conn, paths)
+            digests = [known.get(path_str) for path_str in paths]
+
+        parsed = _run_parse_workers(worker, paths, digests)
+
+        fresh: List[Tuple[str, bytes, Sequence[Symbol]]] = []
+        for i, outcome in zip(pending, parsed):
+            path_str, symbols, warning, sha = outcome
+            if (
+                cache_conn is not None
+                and sha is not None
+                and sha == known.get(path_str)
+            ):
+                cached = _cache.lookup(cache_conn, path_str, sha)
+                if cached is None:
+                    # The entry was replaced by a concurrent run since it was listed
+                    outcome = _parse_file_worker(path_str, hash_source=True)
+                else:
+                    outcome = (path_str, cached, None, None)
+                path_str, symbols, warning, sha = outcome
+
+            outcomes[i] = outcome
+            if warning is None:
+                st = python_files[i][1]
+                _cache.store_recent(path_str, st.st_mtime_ns, st.st_size, symbols)
+            if sha is not None:
+                fresh.append((path_str, sha, symbols))
+
+        if cache_conn is not None:
+            _cache.store(cache_conn, fresh)
+    finally:
+        if cache_conn is not None:
+            cache_conn.close()
+
+    for _path_str, _file_symbols, warning, _sha in outcomes:
+        if warning is not None:
             result.error_count += 1
-            result.warnings.append(f"Syntax error in {file_path}: {exc}")
-            continue
+            result.warnings.append(warning)
 
-        result.symbols.extend(_collect_symbols_from_ast(tree, file_path))
+    # Concatenate the per-file sequences in one pass instead of growing
+    # result.symbols with an extend() per file.
+    result.symbols = list(chain.from_iterable(outcome[1] for outcome in outcomes))
 
     return result
 
 
-def _collect_symbols_from_ast(
-    node: ast.AST, file_path: Path, scope: Optional[str] = None
-) -> List[Symbol]:
-    """Recursively collect symbols from an AST tree."""
-    symbols: List[Symbol] = []
-
-    if isinstance(node, ast.FunctionDef):
-        kind = SymbolKind.METHOD if scope is not None else SymbolKind.FUNCTION
-        end_line = getattr(node, "end_lineno", node.lineno)
-        end_col = getattr(node, "end_col_offset", node.col_offset)
-        symbols.append(
-            Symbol(
-                name=node.name,
-                kind=kind,
-                file_path=file_path,
-                line=node.lineno,
-                column=node.col_offset,
-                end_line=end_line,
-                end_column=end_col,
-                scope=scope,
-                docstring=ast.get_docstring(node),
-            )
-        )
-
-    elif isinstance(node, ast.ClassDef):
-        end_line = getattr(node, "end_lineno", node.lineno)
-        end_col = getattr(node, "end_col_offset", node.col_offset)
-        symbols.append(
-            Symbol(
-                name=node.name,
-                kind=SymbolKind.CLASS,
-                file_path=file_path,
-                line=node.lineno,
-                column=node.col_offset,
-                end_line=end_line,
-                end_column=end_col,
-                scope=scope,
-                docstring=ast.get_docstring(node),
-            )
-        )
-        # Recurse into class body with class scope for methods
-        for child in node.body:
-            symbols.extend(_collect_symbols_from_ast(child, file_path, scope=node.name))
-        return symbols
-
-    elif isinstance(node, (ast.Assign, ast.AnnAssign)) and scope is None:
-        # Module-level variables
-        target_names: List[str] = []
-        if isinstance(node, ast.Assign):
-            for t in node.targets:
-                if isinstance(t, ast.Name):
-                    target_names.append(t.id)
-        else:
-            if isinstance(node.target, ast.Name):
-                target_names.append(node.target.id)
-
-        for name in target_names:
-            line = getattr(node, "lineno", 1)
-            col = getattr(node, "col_offset", 0)
-            end_line = getattr(node, "end_lineno", line)
-            end_col = getattr(node, "end_col_offset", col)
-            symbols.append(
-                Symbol(
-                    name=name,
-                    kind=SymbolKind.VARIABLE,
-                    file_path=file_path,
-                    line=line,
-                    column=col,
-                    end_line=end_line,
-                    end_column=end_col,
-                    scope=None,
-                    docstring=None,
-                )
-            )
-
-    # Recurse into children (for non-class nodes or non-body attributes)
-    for child in ast.iter_child_nodes(node):
-        symbols.extend(_collect_symbols_from_ast(child, file_path, scope=scope))
-
-    return symbols
+def _discover_python_files(
+    root: Path, config: AnalysisConfig, warnings: List[str]
+) -> List[Tuple[str, os.stat_result]]:
+    """Find .py files under ``root`` with an explicit-stack os.scandir walk.
+
+    Returns ``(path, stat)`` pairs; the stat result is reused for caching.
+
+    Directories excluded by a plain ``**/<name>/**`` pattern are skipped
+    without being entered; other files are filtered with
+    AnalysisConfig.should_include(). Files larger than max_file_size are
+    skipped with a warning appended to ``warnings``. Unreadable directories
+    are ignored, as os.walk does, and so are entries that cannot be stat()ed.
+    """
+    # One snapshot of the patterns for both directory pruning and file checks
+    path_filter = config._path_filter()
+    prune = path_filter.pruned_dirs
+    should_include = path_filter.should_include
+    max_file_size = config.max_file_size
+    follow_symlinks = config.follow_symlinks
+    # Followed symlinks can form cycles; remember visited directories then
+    seen: Set[Tuple[int, int]] = set()
+    if follow_symlinks:
+        st = root.stat()
+        seen.add((st.st_dev, st.st_ino))
+
+    python_files: List[Tuple[str, os.stat_result]] = []
+    # (directory, its path relative to root with a trailing '/')
+    stack = [(os.fspath(root), "")]
+    while stack:
+        directory, rel_dir = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    if entry.name in prune:
+                        continue
+                    if follow_symlinks:
+                        st = entry.stat()
+                        if (st.st_dev, st.st_ino) in seen:
+                            continue
+                        seen.add((st.st_dev, st.st_ino))
+                    stack.append((entry.path, rel_dir + entry.name + "/"))
+                elif (
+                    entry.name.endswith(".py")
+                    and entry.is_file()
+                    and should_include(rel_dir + entry.name)
+                ):
+                    st = entry.stat()
+                    if st.st_size > max_file_size:
+                        warnings.append(_too_large_warning(entry.path))
+                    else:
+                        python_files.append((entry.path, st))
+            except OSError:
+                # Removed since the directory was listed, or not accessible
+                continue
+
+    return python_files
+
+
+def _too_large_warning(path: Union[str, Path]) -> str:
+    """Format the warning for a file skipped because of max_file_size."""
+    return f"Skipping {path}: exceeds max_file_size"
+
+
+# Below this many files, process pool startup costs more than it saves.
+_PROCESS_POOL_THRESHOLD = 32
+
+# Above this many files, start kernel readahead for all of them up front.
+_PREFETCH_THRESHOLD = 64
+
+
+def _run_parse_workers(
+    worker: Callable[..., _ParseOutcome],
+    paths: List[str],
+    digests: Optional[List[Optional[bytes]]] = None,
+) -> List[_ParseOutcome]:
+    """Run ``worker`` over ``paths`` and return the outcomes in order.
+
+    When ``digests`` is given, ``worker`` is called with each path and the
+    digest at the same index.
+
+    Large inputs are spread over a process pool, since symbol collection is
+    CPU-bound Python code that does not scale across threads. Smaller inputs
+    use a thread pool, which still overlaps file reads and parsing.
+    """
+    args: Tuple[List[Any], ...] = (paths,) if digests is None else (paths, digests)
+
+    # Queues cold-cache reads before any pool starts; on a warm page cache it
+    # costs about 2us per file. Skipped with the disk cache, where most files
+    # are cache hits that are only read and hashed, so the extra open and
+    # close per file is a large share of the work. Done synchronously: a
+    # helper thread still running when the process pool forks would be unsafe.
+    if (
+        digests is None
+        and len(paths) > _PREFETCH_THRESHOLD
+        and hasattr(os, "posix_fadvise")
+    ):
+        _prefetch_files(paths)
+
+    if len(paths) <= 1:
+        return [worker(*item) for item in zip(*args)]
+
+    # Imported on first use: concurrent.futures pulls in multiprocessing
+    # and logging, about half of this package's import time.
+    from concurrent.futures import ThreadPoolExecutor
+
+    cpu_count = os.cpu_count() or 1
+    if len(paths) > _PROCESS_POOL_THRESHOLD and cpu_count > 1:
+        outcomes = _map_in_processes(worker, args, cpu_count)
+        if outcomes is not None:
+            return outcomes
+
+    with ThreadPoolExecutor(max_workers=cpu_count) as executor:
+        return list(executor.map(worker, *args))
+
+
+def _map_in_processes(
+    worker: Callable[..., _ParseOutcome], args: Tuple[List[Any], ...], cpu_count: int
+) -> Optional[List[_ParseOutcome]]:
+    """Run ``worker`` over the zipped ``args`` in a process pool.
+
+    Returns None if the pool cannot start its worker processes, as in some
+    sandboxes, so the caller can fall back to threads. Exceptions raised by
+    ``worker`` for individual files propagate unchanged.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    try:
+        executor = ProcessPoolExecutor(max_workers=cpu_count)
+    except OSError:
+        return None
+
+    with executor:
+        chunksize = max(1, len(args[0]) // (cpu_count * 4))
+        try:
+            # map() submits every chunk up front, which starts the workers
+            results = executor.map(worker, *args, chunksize=chunksize)
+        except (OSError, BrokenProcessPool):
+            return None
+
+        try:
+            return list(results)
+        except BrokenProcessPool:
+            # A worker process died, e.g. it could not be started
+            return None
+
+
+def _prefetch_files(paths: List[str]) -> None:
+    """Ask the kernel to read ``paths`` into the page cache asynchronously.
+
+    POSIX_FADV_WILLNEED queues readahead without waiting for it, so by the
+    time a worker reads a file it is usually already cached. This is only a
+    hint; errors are ignored.
+    """
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+_ONLY_AST = ast.PyCF_ONLY_AST
+
+
+def _parse_file_worker(
+    path_str: str, cached_sha: Optional[bytes] = None, hash_source: bool = False
+) -> _ParseOutcome:
+    """Parse a single file and collect its symbols.
+
+    Runs in worker threads and processes, so it must stay a picklable
+    module-level function that touches no shared mutable state. Syntax
+    errors are reported as a warning string instead of raised so the caller
+    can aggregate them.
+
+    When ``hash_source`` is set, the SHA-256 digest of the bytes that were
+    parsed is returned so the caller can store the symbols in the cache. If
+    that digest equals ``cached_sha``, parsing is skipped and no symbols are
+    returned; the caller loads them from the cache instead.
+    """
+    file_path = Path(path_str)
+    # compile() decodes bytes itself, honouring BOMs and coding declarations
+    raw = file_path.read_bytes()
+    sha = hashlib.sha256(raw).digest() if hash_source else None
+    if sha is not None and sha == cached_sha:
+        return path_str, [], None, sha
+
+    try:
+        # Same as ast.parse() without the wrapper call; dont_inherit keeps
+        # this module's __future__ flags out of the parse.
+        tree = compile(raw, path_str, "exec", _ONLY_AST, dont_inherit=True)
+    except SyntaxError as exc:
+        return path_str, [], f"Syntax error in {file_path}: {exc}", None
+
+    return path_str, list(_symbols.iter_symbols(tree, file_path)), None, sha
 
 
 def capabilities() -> List[str]:
@@ -215,9 +424,23 @@ def capabilities() -> List[str]:
         >>> if 'deep-mode' in caps:
         ...     print("Deep Mode available")
     """
+    # A fresh list per call, so callers may mutate it without affecting
+    # the cached tuple.
+    return list(_cached_capabilities())
+
+
+@lru_cache(maxsize=1)
+def _cached_capabilities() -> Tuple[str, ...]:
+    """Query the Rust core once; capabilities are fixed at build time."""
+    # The binding returns a shared tuple of interned strings
     return _rust_capabilities()
 
 
+# MAJOR.MINOR.PATCH with ASCII digits only (\d would also match other
+# Unicode digits)
+_SEMVER_RE = re.compile(r"[0-9]+\.[0-9]+\.[0-9]+")
+
+
 def check_compatibility(client_version: str) -> bool:
     """Check if a client version is compatible with this core version.
 
@@ -228,39 +451,34 @@ def check_compatibility(client_version: str) -> bool:
         True if compatible, False otherwise
 
     Raises:
-        ValueError: If version string is malformed
+        ValueError: If version string is malformed, including when it has
+            surrounding whitespace
 
     Example:
         >>> if check_compatibility("0.1.5"):
         ...     print("Compatible")
     """
+    # Checked before the cache so non-string (possibly unhashable) arguments
+    # never become cache keys.
     if not isinstance(client_version, str):
         raise ValueError("client_version must be a string")
 
-    # Preserve original value for error messages and validation; do not
-    # silently accept surrounding whitespace.
-    if client_version != client_version.strip():
-        raise ValueError(f"Invalid version string (whitespace): {client_version!r}")
-
-    version = client_version
-    parts = version.split(".")
-    if len(parts) != 3 or not all(part.isdigit() for part in parts):
-        # Invalid semantic version format
+    # Reject malformed strings without an FFI round-trip; the Rust core
+    # still validates on its own.
+    if _SEMVER_RE.fullmatch(client_version) is None:
+        # Surrounding whitespace is rejected, not stripped; say so explicitly
+        if client_version != client_version.strip():
+            raise ValueError(f"Invalid version string (whitespace): {client_version!r}")
         raise ValueError(f"Invalid version string: {client_version!r}")
 
-    major, minor, _patch = (int(p) for p in parts)
-
-    # Different major version is incompatible
-    if major != 0:
-        return False
+    return _cached_check_compatibility(client_version)
 
-    # For now we only consider 0.1.x compatible; other 0.x.y are treated as
-    # potentially incompatible and return False.
-    if minor != 1:
-        return False
 
-    # Delegate final decision to the Rust implementation for 0.1.x range
-    return _rust_check_compatibility(version)
+@lru_cache(maxsize=256)
+def _cached_check_compatibility(client_version: str) -> bool:
+    """Memoized Rust check; malformed versions raise and are not cached."""
+    # Format validation and the version policy both live in the Rust core
+    return _rust_check_compatibility(client_version)
 
 
 __all__ = [
@@ -275,6 +493,7 @@ __all__ = [
     "Symbol",
     "Dependency",
     "SymbolKind",
+    "SymbolTable",
     # Version info
     "__version__",
     "__api_version__",
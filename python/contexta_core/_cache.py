@@ -0,0 +1,193 @@
+"""Symbol caches for the Python analyzer.
+
+Symbols extracted from a file are pickled into a SQLite database keyed by
+the file path and the SHA-256 of its contents, so unchanged files are not
+re-parsed across analyze() calls. Entries are unpickled on load; only point
+the cache at a directory you trust.
+
+Independently, the most recently analyzed files are kept in memory, keyed
+by path and validated against the file's mtime and size. Every hit builds
+fresh Symbol objects, so results stay independent of each other.
+"""
+
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .result import Symbol, SymbolKind
+
+CACHE_FILENAME = "symbols.sqlite3"
+
+# Bump when Symbol or the extraction rules change so stale entries are
+# dropped instead of being returned.
+_SCHEMA_VERSION = 1
+
+
+def cache_file(root: Path) -> Path:
+    """Return the path of the cache database stored under ``root``."""
+    return root / CACHE_FILENAME
+
+
+def open_cache(root: Path) -> sqlite3.Connection:
+    """Open the cache database under ``root``, creating it if needed."""
+    root.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(cache_file(root)))
+    (version,) = conn.execute("PRAGMA user_version").fetchone()
+    with conn:
+        if version != _SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS symbols")
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS symbols ("
+            "path TEXT, sha BLOB, pickle BLOB, PRIMARY KEY (path, sha))"
+        )
+    return conn
+
+
+def lookup(conn: sqlite3.Connection, path: str, sha: bytes) -> Optional[List[Symbol]]:
+    """Return the cached symbols for ``path`` with content hash ``sha``.
+
+    Returns None on a cache miss.
+    """
+    row = conn.execute(
+        "SELECT pickle FROM symbols WHERE path = ? AND sha = ?", (path, sha)
+    ).fetchone()
+    if row is None:
+        return None
+    symbols: List[Symbol] = pickle.loads(row[0])
+    return symbols
+
+
+# SQLite before 3.32 allows at most 999 parameters per statement.
+_MAX_PARAMS = 500
+
+
+def stored_digests(conn: sqlite3.Connection, paths: Sequence[str]) -> Dict[str, bytes]:
+    """Return the content hash of the cached entry for each of ``paths``.
+
+    Paths without an entry are left out.
+    """
+    digests: Dict[str, bytes] = {}
+    for start in range(0, len(paths), _MAX_PARAMS):
+        batch = paths[start : start + _MAX_PARAMS]
+        placeholders = ",".join("?" * len(batch))
+        digests.update(
+            conn.execute(
+                f"SELECT path, sha FROM symbols WHERE path IN ({placeholders})",
+                batch,
+            )
+        )
+    return digests
+
+
+def store(
+    conn: sqlite3.Connection, entries: Iterable[Tuple[str, bytes, Sequence[Symbol]]]
+) -> None:
+    """Store ``(path, sha, symbols)`` entries in a single transaction.
+
+    Older entries for the same paths are removed.
+    """
+    rows = [
+        (path, sha, pickle.dumps(symbols, pickle.HIGHEST_PROTOCOL))
+        for path, sha, symbols in entries
+    ]
+    if not rows:
+        return
+
+    with conn:
+        conn.executemany("DELETE FROM symbols WHERE path = ?", [(r[0],) for r in rows])
+        conn.executemany(
+            "INSERT INTO symbols (path, sha, pickle) VALUES (?, ?, ?)", rows
+        )
+
+
+# In-process cache for long-running clients that re-analyze the same files:
+# path -> (st_mtime_ns, st_size, frozen symbols), least recently used first.
+# Symbols are kept as named tuples and rebuilt on every hit, so results never
+# share the mutable Symbol objects (or their metadata dicts) with each other.
+class _FrozenSymbol(NamedTuple):
+    """Immutable snapshot of the fields of a Symbol."""
+
+    name: str
+    kind: SymbolKind
+    file_path: Path
+    line: int
+    column: int
+    end_line: int
+    end_column: int
+    scope: Optional[str]
+    docstring: Optional[str]
+    metadata: Dict[str, Any]
+
+
+_RecentEntry = Tuple[int, int, Tuple[_FrozenSymbol, ...]]
+_SYMBOL_CACHE: "OrderedDict[str, _RecentEntry]" = OrderedDict()
+_SYMBOL_CACHE_SIZE = 4096
+_symbol_cache_lock = threading.Lock()
+
+
+def lookup_recent(path: str, mtime_ns: int, size: int) -> Optional[List[Symbol]]:
+    """Return symbols remembered for ``path`` if the file looks unchanged.
+
+    The file counts as unchanged when its mtime and size match the stored
+    ones; otherwise the stale entry is dropped. Each call returns new Symbol
+    objects.
+    """
+    with _symbol_cache_lock:
+        entry = _SYMBOL_CACHE.get(path)
+        if entry is None:
+            return None
+        if entry[0] != mtime_ns or entry[1] != size:
+            del _SYMBOL_CACHE[path]
+            return None
+        _SYMBOL_CACHE.move_to_end(path)
+        frozen = entry[2]
+
+    return [_thaw(symbol) for symbol in frozen]
+
+
+def store_recent(
+    path: str, mtime_ns: int, size: int, symbols: Sequence[Symbol]
+) -> None:
+    """Remember the symbols of ``path``, evicting the least recently used."""
+    frozen = tuple(_freeze(symbol) for symbol in symbols)
+    with _symbol_cache_lock:
+        _SYMBOL_CACHE[path] = (mtime_ns, size, frozen)
+        _SYMBOL_CACHE.move_to_end(path)
+        while len(_SYMBOL_CACHE) > _SYMBOL_CACHE_SIZE:
+            _SYMBOL_CACHE.popitem(last=False)
+
+
+def _freeze(symbol: Symbol) -> _FrozenSymbol:
+    """Snapshot the fields of ``symbol``, copying its metadata."""
+    return _FrozenSymbol(
+        name=symbol.name,
+        kind=symbol.kind,
+        file_path=symbol.file_path,
+        line=symbol.line,
+        column=symbol.column,
+        end_line=symbol.end_line,
+        end_column=symbol.end_column,
+        scope=symbol.scope,
+        docstring=symbol.docstring,
+        metadata=dict(symbol.metadata),
+    )
+
+
+def _thaw(frozen: _FrozenSymbol) -> Symbol:
+    """Build a new Symbol from a snapshot taken by _freeze()."""
+    return Symbol(
+        name=frozen.name,
+        kind=frozen.kind,
+        file_path=frozen.file_path,
+        line=frozen.line,
+        column=frozen.column,
+        end_line=frozen.end_line,
+        end_column=frozen.end_column,
+        scope=frozen.scope,
+        docstring=frozen.docstring,
+        metadata=dict(frozen.metadata),
+    )
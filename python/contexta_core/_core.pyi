@@ -4,7 +4,7 @@ This file provides type hints for functions implemented in Rust and exposed via
 """
 
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, Tuple
 from .config import AnalysisConfig
 from .result import AnalysisResult
 
@@ -39,15 +39,16 @@ def analyze(
     """
     ...
 
-def capabilities() -> List[str]:
-    """Return list of available analyzer capabilities.
+def capabilities() -> Tuple[str, ...]:
+    """Return tuple of available analyzer capabilities.
 
     This function queries the Rust core for supported features. Capabilities
-    may vary based on compile-time features (e.g., deep-mode).
+    may vary based on compile-time features (e.g., deep-mode). The tuple is
+    built once and the same object is returned on every call.
 
     Returns:
-        List of capability strings, e.g.:
-        ['analyze', 'search', 'python-support', 'typescript-support', 'rust-support']
+        Tuple of capability strings, e.g.:
+        ('analyze', 'search', 'python-support', 'typescript-support', 'rust-support')
 
     Example:
         >>> from contexta_core import capabilities
@@ -0,0 +1,165 @@
+"""Symbol extraction from Python ASTs.
+
+This module is kept free of I/O and fully annotated so it can be compiled
+with mypyc (``mypyc contexta_core/_symbols.py``). A compiled extension
+module shadows this file on import; without one the pure-Python version
+is used.
+"""
+
+import ast
+import inspect
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from .result import Symbol, SymbolKind
+
+# Fields holding statement lists. Definitions and assignments can only appear
+# in these, so the walk below never has to descend into expressions.
+_BLOCK_FIELDS = frozenset({"body", "orelse", "finalbody", "handlers", "cases"})
+
+# Per node type, the subset of ``_fields`` that are in ``_BLOCK_FIELDS``.
+_block_fields_by_type: Dict[type, Tuple[str, ...]] = {}
+
+
+# Symbol handlers, dispatched on the exact node type. Each appends the symbols
+# for ``node`` to ``out`` and returns the scope for the node's children.
+_Handler = Callable[[Any, Path, Optional[str], List[Symbol]], Optional[str]]
+
+
+def _docstring(node: Any) -> Optional[str]:
+    """Return the cleaned docstring of a definition, like ast.get_docstring()."""
+    body = node.body
+    if body and type(body[0]) is ast.Expr:
+        value = body[0].value
+        if type(value) is ast.Constant and type(value.value) is str:
+            return inspect.cleandoc(value.value)
+    return None
+
+
+def _handle_function(
+    node: Any, file_path: Path, scope: Optional[str], out: List[Symbol]
+) -> Optional[str]:
+    """Record a function, or a method when inside a class."""
+    out.append(
+        Symbol(
+            name=node.name,
+            kind=SymbolKind.FUNCTION if scope is None else SymbolKind.METHOD,
+            file_path=file_path,
+            line=node.lineno,
+            column=node.col_offset,
+            end_line=getattr(node, "end_lineno", node.lineno),
+            end_column=getattr(node, "end_col_offset", node.col_offset),
+            scope=scope,
+            docstring=_docstring(node),
+        )
+    )
+    return scope
+
+
+def _handle_class(
+    node: Any, file_path: Path, scope: Optional[str], out: List[Symbol]
+) -> Optional[str]:
+    """Record a class; methods in its body are scoped to it."""
+    out.append(
+        Symbol(
+            name=node.name,
+            kind=SymbolKind.CLASS,
+            file_path=file_path,
+            line=node.lineno,
+            column=node.col_offset,
+            end_line=getattr(node, "end_lineno", node.lineno),
+            end_column=getattr(node, "end_col_offset", node.col_offset),
+            scope=scope,
+            docstring=_docstring(node),
+        )
+    )
+    name: str = node.name
+    return name
+
+
+def _handle_assign(
+    node: Any, file_path: Path, scope: Optional[str], out: List[Symbol]
+) -> Optional[str]:
+    """Record module-level variables bound by a plain assignment."""
+    if scope is None:
+        for target in node.targets:
+            if type(target) is ast.Name:
+                out.append(_variable(target, node, file_path))
+    return scope
+
+
+def _handle_annassign(
+    node: Any, file_path: Path, scope: Optional[str], out: List[Symbol]
+) -> Optional[str]:
+    """Record a module-level variable bound by an annotated assignment."""
+    if scope is None and type(node.target) is ast.Name:
+        out.append(_variable(node.target, node, file_path))
+    return scope
+
+
+def _variable(target: Any, node: Any, file_path: Path) -> Symbol:
+    """Build the symbol for a variable named by ``target`` in ``node``."""
+    return Symbol(
+        name=target.id,
+        kind=SymbolKind.VARIABLE,
+        file_path=file_path,
+        line=node.lineno,
+        column=node.col_offset,
+        end_line=getattr(node, "end_lineno", node.lineno),
+        end_column=getattr(node, "end_col_offset", node.col_offset),
+        scope=None,
+        docstring=None,
+    )
+
+
+_HANDLERS: Dict[type, _Handler] = {
+    ast.FunctionDef: _handle_function,
+    ast.AsyncFunctionDef: _handle_function,
+    ast.ClassDef: _handle_class,
+    ast.Assign: _handle_assign,
+    ast.AnnAssign: _handle_annassign,
+}
+
+
+def iter_symbols(
+    node: ast.AST, file_path: Path, scope: Optional[str] = None
+) -> Iterator[Symbol]:
+    """Yield symbols from an AST tree using an iterative depth-first walk.
+
+    Symbols are yielded in source order. Methods are reported with the name
+    of their enclosing class as scope.
+    """
+    # Bind hot globals and attributes to locals once; this loop runs for
+    # every statement of every file.
+    handlers = _HANDLERS
+    block_fields_by_type = _block_fields_by_type
+
+    # Nodes are typed Any: the fields read below differ per node type and
+    # are only accessed by the handler for that type.
+    stack: Deque[Tuple[Any, Optional[str]]] = deque([(node, scope)])
+    push = stack.append
+    pop = stack.pop
+    out: List[Symbol] = []
+
+    while stack:
+        current, scope = pop()
+        t = type(current)
+        child_scope = scope
+
+        handler = handlers.get(t)
+        if handler is not None:
+            child_scope = handler(current, file_path, scope, out)
+            if out:
+                yield from out
+                out.clear()
+
+        fields = block_fields_by_type.get(t)
+        if fields is None:
+            fields = tuple(f for f in t._fields if f in _BLOCK_FIELDS)
+            block_fields_by_type[t] = fields
+
+        # Push in reverse so children are popped in source order
+        for field in reversed(fields):
+            for child in reversed(getattr(current, field)):
+                push((child, child_scope))
@@ -1,7 +1,20 @@
 """Configuration dataclasses for code analysis."""
 
+import re
 from dataclasses import dataclass, field
-from typing import Optional, List, Callable, Any
+from pathlib import Path
+from typing import (
+    Optional,
+    List,
+    Callable,
+    Any,
+    FrozenSet,
+    NamedTuple,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 
 @dataclass
@@ -17,6 +30,7 @@ class AnalysisConfig:
         follow_symlinks: Whether to follow symbolic links (default: False)
         audit_callback: Optional callback for Deep Mode audit events
         language_filters: Optional list of language extensions to analyze (e.g., ['.py', '.ts'])
+        cache_dir: Optional directory for the persistent symbol cache (default: disabled)
     """
 
     enable_deep_mode: bool = False
@@ -38,6 +52,7 @@ class AnalysisConfig:
     follow_symlinks: bool = False
     audit_callback: Optional[Callable[[str, Any], None]] = None
     language_filters: Optional[List[str]] = None
+    cache_dir: Optional[Union[str, Path]] = None
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -53,3 +68,109 @@ class AnalysisConfig:
                 "Deep Mode requires audit_callback for compliance tracking. "
                 "Set audit_callback to a function(event_type: str, data: dict) -> None"
             )
+
+        # Compiled on first use and again whenever the pattern lists change
+        self._filter_key: Optional[_PatternKey] = None
+        self._filter = self._path_filter()
+
+    def should_include(self, rel_path: str) -> bool:
+        """Check whether a file should be analyzed according to the patterns.
+
+        Args:
+            rel_path: Path relative to the analysis root, using '/' separators
+
+        Returns:
+            True if the path matches no exclude pattern and, when
+            include_patterns is set, at least one include pattern
+        """
+        return self._path_filter().should_include(rel_path)
+
+    def _path_filter(self) -> "_PathFilter":
+        """Return the filter compiled from the current pattern lists."""
+        key = (
+            tuple(self.exclude_patterns),
+            None if self.include_patterns is None else tuple(self.include_patterns),
+        )
+        if key != self._filter_key:
+            self._filter = _PathFilter(
+                exclude=_compile_globs(key[0]),
+                include=None if key[1] is None else _compile_globs(key[1]),
+                pruned_dirs=_pruned_dir_names(key[0]),
+            )
+            self._filter_key = key
+        return self._filter
+
+
+# (exclude_patterns, include_patterns) a _PathFilter was compiled from
+_PatternKey = Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]
+
+
+class _PathFilter(NamedTuple):
+    """Exclude and include patterns compiled together."""
+
+    exclude: Pattern[str]
+    include: Optional[Pattern[str]]
+    # Directory names whose whole subtree is excluded
+    pruned_dirs: FrozenSet[str]
+
+    def should_include(self, rel_path: str) -> bool:
+        """Same as AnalysisConfig.should_include(), for these patterns."""
+        if self.exclude.fullmatch(rel_path):
+            return False
+        if self.include is not None:
+            return self.include.fullmatch(rel_path) is not None
+        return True
+
+
+def _pruned_dir_names(exclude_patterns: Sequence[str]) -> FrozenSet[str]:
+    """Return directory names that ``**/<name>/**`` patterns exclude entirely."""
+    names = set()
+    for pattern in exclude_patterns:
+        if pattern.startswith("**/") and pattern.endswith("/**"):
+            name = pattern[3:-3]
+            if name and not any(c in name for c in "*?[/"):
+                names.add(name)
+    return frozenset(names)
+
+
+def _compile_globs(patterns: Sequence[str]) -> Pattern[str]:
+    """Compile glob patterns into a single alternation regex."""
+    return re.compile("|".join(f"(?:{_glob_to_regex(p)})" for p in patterns))
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore-style glob into a regular expression.
+
+    ``**`` matches across directories while ``*``, ``?`` and ``[...]`` stay
+    within one path segment. Patterns without a slash match at any depth.
+    """
+    if "/" not in pattern:
+        pattern = "**/" + pattern
+    pattern = pattern.lstrip("/")
+
+    parts: List[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2 :]:
+            end = pattern.index("]", i + 2)
+            body = pattern[i + 1 : end]
+            if body[0] == "!":
+                body = "^" + body[1:]
+            parts.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(parts)
@@ -1,10 +1,20 @@
 """Result dataclasses for code analysis."""
 
+import sys
+from array import array
 from dataclasses import dataclass, field
+from itertools import compress
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Union, overload
 from enum import Enum
 
+# Results hold one Symbol per definition, so drop the per-instance __dict__
+# where dataclasses support it (Python 3.10+).
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Concrete Path class on this platform (PosixPath or WindowsPath)
+_PATH_TYPE = type(Path())
+
 
 class SymbolKind(str, Enum):
     """Symbol types identified during analysis."""
@@ -23,7 +33,7 @@ class SymbolKind(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Symbol:
     """A code symbol (function, class, variable, etc.) extracted from analysis.
 
@@ -53,18 +63,144 @@ class Symbol:
 
     def __post_init__(self):
         """Convert file_path to Path if it's a string."""
-        if isinstance(self.file_path, str):
+        # Exact type checks first: the analyzer always passes canonical types,
+        # and SymbolKind members are themselves str instances.
+        if type(self.file_path) is not _PATH_TYPE and isinstance(self.file_path, str):
             self.file_path = Path(self.file_path)
 
         # Convert string kind to SymbolKind enum
-        if isinstance(self.kind, str):
+        if type(self.kind) is not SymbolKind and isinstance(self.kind, str):
             try:
                 self.kind = SymbolKind(self.kind)
             except ValueError:
                 self.kind = SymbolKind.UNKNOWN
 
 
-@dataclass
+# SymbolKind members in definition order; SymbolTable stores their indices.
+_KINDS: List[SymbolKind] = list(SymbolKind)
+_KIND_CODES: Dict[SymbolKind, int] = {kind: i for i, kind in enumerate(_KINDS)}
+
+
+class SymbolTable:
+    """Column-oriented storage for a sequence of symbols.
+
+    Each Symbol field is kept in its own list or array, so scanning one
+    field across all symbols touches only that column. Indexing and
+    iteration build Symbol objects on demand.
+
+    Attributes:
+        names: Symbol names
+        kinds: SymbolKind of each symbol, stored as an index into SymbolKind
+        file_paths: Files containing each symbol
+        lines: Start lines (1-indexed)
+        columns: Start columns (0-indexed)
+        end_lines: End lines (1-indexed)
+        end_columns: End columns (0-indexed)
+        scopes: Parent scopes, or None
+        docstrings: Docstrings, or None
+        metadata: Metadata dicts, shared with the symbols built from them
+    """
+
+    __slots__ = (
+        "names",
+        "kinds",
+        "file_paths",
+        "lines",
+        "columns",
+        "end_lines",
+        "end_columns",
+        "scopes",
+        "docstrings",
+        "metadata",
+    )
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.kinds = array("B")
+        self.file_paths: List[Path] = []
+        self.lines = array("i")
+        self.columns = array("i")
+        self.end_lines = array("i")
+        self.end_columns = array("i")
+        self.scopes: List[Optional[str]] = []
+        self.docstrings: List[Optional[str]] = []
+        self.metadata: List[Dict[str, Any]] = []
+
+    @classmethod
+    def from_symbols(cls, symbols: Iterable[Symbol]) -> "SymbolTable":
+        """Build a table holding the given symbols in order.
+
+        Args:
+            symbols: Symbols to store
+
+        Returns:
+            A new SymbolTable
+        """
+        symbols = list(symbols)
+        table = cls()
+        table.names = [s.name for s in symbols]
+        table.kinds = array("B", [_KIND_CODES[s.kind] for s in symbols])
+        table.file_paths = [s.file_path for s in symbols]
+        table.lines = array("i", [s.line for s in symbols])
+        table.columns = array("i", [s.column for s in symbols])
+        table.end_lines = array("i", [s.end_line for s in symbols])
+        table.end_columns = array("i", [s.end_column for s in symbols])
+        table.scopes = [s.scope for s in symbols]
+        table.docstrings = [s.docstring for s in symbols]
+        table.metadata = [s.metadata for s in symbols]
+        return table
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @overload
+    def __getitem__(self, index: int) -> Symbol: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Symbol]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Symbol, List[Symbol]]:
+        """Build the Symbol at ``index``, or a list of Symbols for a slice."""
+        if isinstance(index, slice):
+            return [self._build(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SymbolTable index out of range")
+        return self._build(index)
+
+    def __iter__(self) -> Iterator[Symbol]:
+        return map(self._build, range(len(self)))
+
+    def filter_by_kind(self, kind: SymbolKind) -> List[int]:
+        """Return the indices of all symbols of the given kind.
+
+        Args:
+            kind: Symbol kind to select
+
+        Returns:
+            Indices in ascending order
+        """
+        code = _KIND_CODES[SymbolKind(kind)]
+        return list(compress(range(len(self.kinds)), map(code.__eq__, self.kinds)))
+
+    def _build(self, i: int) -> Symbol:
+        """Construct the Symbol stored at row ``i``."""
+        return Symbol(
+            name=self.names[i],
+            kind=_KINDS[self.kinds[i]],
+            file_path=self.file_paths[i],
+            line=self.lines[i],
+            column=self.columns[i],
+            end_line=self.end_lines[i],
+            end_column=self.end_columns[i],
+            scope=self.scopes[i],
+            docstring=self.docstrings[i],
+            metadata=self.metadata[i],
+        )
+
+
+@dataclass(**_SLOTS)
 class Dependency:
     """A dependency relationship between symbols or modules.
 
@@ -83,7 +219,7 @@ class Dependency:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AnalysisResult:
     """Complete analysis result for a codebase.
 
@@ -103,6 +239,14 @@ class AnalysisResult:
     warnings: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def symbol_table(self) -> SymbolTable:
+        """Return the symbols in column-oriented form.
+
+        The table is a snapshot; later changes to ``symbols`` are not
+        reflected in it.
+        """
+        return SymbolTable.from_symbols(self.symbols)
+
     def summary(self) -> str:
         """Generate a human-readable summary of the analysis."""
         return (
@@ -0,0 +1,25 @@
+"""Shared fixtures for the contexta_core test suite."""
+
+import pytest
+
+from contexta_core import capabilities
+
+
+@pytest.fixture(scope="session")
+def caps():
+    """Capabilities reported by the installed core, queried once per session.
+
+    Shared across tests; do not mutate.
+    """
+    return capabilities()
+
+
+@pytest.fixture(scope="session")
+def caps_set(caps):
+    """The session's capabilities as a frozenset, for membership checks."""
+    return frozenset(caps)
+
+
+def pytest_configure(config):
+    """Warm the capabilities cache so no single test pays for the first query."""
+    capabilities()
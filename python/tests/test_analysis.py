@@ -6,6 +6,8 @@ import tempfile
 import os
 
 from contexta_core import analyze, AnalysisConfig, AnalysisResult, SymbolKind
+from contexta_core import _cache
+import contexta_core
 
 
 @pytest.fixture
@@ -94,6 +96,21 @@ class TestAnalyzeBasic:
         result = analyze(str(temp_python_file))
         assert isinstance(result, AnalysisResult)
 
+    def test_analyze_with_pathlike(self, temp_python_file):
+        """Test that analyze() accepts any os.PathLike object."""
+
+        class PathLike:
+            def __fspath__(self):
+                return str(temp_python_file)
+
+        result = analyze(PathLike())
+        assert result.file_count == 1
+
+    def test_analyze_rejects_bytes_path(self, temp_python_file):
+        """Test that analyze() rejects bytes paths."""
+        with pytest.raises(TypeError):
+            analyze(os.fsencode(str(temp_python_file)))  # type: ignore
+
     def test_analyze_finds_symbols(self, temp_python_file):
         """Test that analyze() finds symbols in the file."""
         result = analyze(temp_python_file)
@@ -127,6 +144,24 @@ class TestAnalyzeBasic:
         var_names = [s.name for s in result.symbols if s.kind == SymbolKind.VARIABLE]
         assert "PI" in var_names
 
+    def test_analyze_finds_async_functions(self, tmp_path):
+        """Test that analyze() reports async functions and methods."""
+        source = tmp_path / "aio.py"
+        source.write_text(
+            "async def fetch():\n"
+            '    """Fetch data."""\n'
+            "\n"
+            "class Client:\n"
+            "    async def close(self):\n"
+            "        pass\n"
+        )
+        result = analyze(source)
+        kinds = {s.name: (s.kind, s.scope) for s in result.symbols}
+        assert kinds["fetch"] == (SymbolKind.FUNCTION, None)
+        assert kinds["close"] == (SymbolKind.METHOD, "Client")
+        fetch = next(s for s in result.symbols if s.name == "fetch")
+        assert fetch.docstring == "Fetch data."
+
 
 class TestAnalyzeDirectory:
     """Test analyze() with directories."""
@@ -146,6 +181,154 @@ class TestAnalyzeDirectory:
         assert "main" in function_names
         assert "helper" in function_names
 
+    def test_analyze_directory_skips_excluded_dirs(self, temp_directory):
+        """Test that directories matched by exclude_patterns are not analyzed."""
+        for name in ("node_modules", "__pycache__", ".venv"):
+            os.makedirs(os.path.join(temp_directory, name, "nested"))
+            with open(os.path.join(temp_directory, name, "nested", "x.py"), "w") as f:
+                f.write("def excluded():\n    pass\n")
+
+        result = analyze(temp_directory)
+        names = [s.name for s in result.symbols]
+        assert result.file_count == 2
+        assert "excluded" not in names
+
+        result = analyze(temp_directory, AnalysisConfig(exclude_patterns=[]))
+        assert result.file_count == 5
+
+    def test_analyze_directory_skips_vanished_file(self, temp_directory, monkeypatch):
+        """Test that a file that fails stat() does not hide its siblings."""
+        scandir = os.scandir
+
+        class VanishedEntry:
+            def __init__(self, entry):
+                self.name = entry.name
+                self.path = entry.path
+
+            def is_dir(self, follow_symlinks=True):
+                return False
+
+            def is_file(self):
+                return True
+
+            def stat(self):
+                raise FileNotFoundError(self.path)
+
+        class VanishingScandir:
+            """os.scandir() stand-in whose first entry fails stat()."""
+
+            def __init__(self, path):
+                with scandir(path) as it:
+                    self._entries = sorted(it, key=lambda e: e.name != "main.py")
+                self._entries[0] = VanishedEntry(self._entries[0])
+
+            def __enter__(self):
+                return iter(self._entries)
+
+            def __exit__(self, *exc_info):
+                return False
+
+        monkeypatch.setattr(os, "scandir", VanishingScandir)
+        result = analyze(temp_directory)
+        assert result.file_count == 1
+        assert "helper" in [s.name for s in result.symbols]
+
+    def test_analyze_directory_follow_symlinks(self, temp_directory):
+        """Test that symlinked directories are only followed when configured."""
+        try:
+            os.symlink(temp_directory, os.path.join(temp_directory, "loop"))
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks are not supported on this platform")
+
+        assert analyze(temp_directory).file_count == 2
+        config = AnalysisConfig(follow_symlinks=True)
+        assert analyze(temp_directory, config).file_count == 2
+
+    def test_analyze_large_directory(self, tmp_path):
+        """Test that analyze() handles directories large enough for a worker pool."""
+        for i in range(40):
+            (tmp_path / f"module_{i}.py").write_text(f"def func_{i}():\n    pass\n")
+
+        result = analyze(tmp_path)
+        function_names = {
+            s.name for s in result.symbols if s.kind == SymbolKind.FUNCTION
+        }
+        assert result.file_count == 40
+        assert function_names == {f"func_{i}" for i in range(40)}
+
+    def test_analyze_falls_back_to_threads(self, tmp_path, monkeypatch):
+        """Test that analyze() uses threads when processes cannot start."""
+        import concurrent.futures
+
+        for i in range(40):
+            (tmp_path / f"module_{i}.py").write_text(f"def func_{i}():\n    pass\n")
+
+        def no_processes(*args, **kwargs):
+            raise OSError("cannot start worker processes")
+
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_processes)
+
+        result = analyze(tmp_path)
+        assert result.file_count == 40
+        assert len(result.symbols) == 40
+
+    def test_analyze_worker_error_propagates(self, tmp_path, monkeypatch):
+        """Test that a per-file error in a process pool is not retried on threads."""
+        import concurrent.futures
+
+        for i in range(40):
+            (tmp_path / f"module_{i}.py").write_text(f"def func_{i}():\n    pass\n")
+
+        discover = contexta_core._discover_python_files
+
+        def discover_then_delete(root, config, warnings):
+            found = discover(root, config, warnings)
+            (tmp_path / "module_0.py").unlink()
+            return found
+
+        def no_threads(*args, **kwargs):
+            raise AssertionError("fell back to the thread pool")
+
+        monkeypatch.setattr(
+            contexta_core, "_discover_python_files", discover_then_delete
+        )
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", no_threads)
+
+        with pytest.raises(FileNotFoundError):
+            analyze(tmp_path)
+
+    @pytest.mark.skipif(
+        not hasattr(os, "posix_fadvise"), reason="posix_fadvise unavailable"
+    )
+    def test_analyze_prefetches_large_directory(self, tmp_path, monkeypatch):
+        """Test that analyze() prefetches files above the prefetch threshold."""
+        count = contexta_core._PREFETCH_THRESHOLD + 16
+        for i in range(count):
+            (tmp_path / f"module_{i}.py").write_text(f"def func_{i}():\n    pass\n")
+
+        prefetched = []
+        prefetch = contexta_core._prefetch_files
+
+        def recording_prefetch(paths):
+            prefetched.extend(paths)
+            prefetch(paths)
+
+        monkeypatch.setattr(contexta_core, "_prefetch_files", recording_prefetch)
+        result = analyze(tmp_path)
+
+        assert len(prefetched) == count
+        assert result.file_count == count
+        assert len(result.symbols) == count
+
+        # With the disk cache the files are read for hashing anyway
+        prefetched.clear()
+        _cache._SYMBOL_CACHE.clear()
+        result = analyze(tmp_path, AnalysisConfig(cache_dir=tmp_path / "cache"))
+        assert prefetched == []
+        assert result.file_count == count
+
 
 class TestAnalyzeConfig:
     """Test analyze() with configuration options."""
@@ -166,6 +349,69 @@ class TestAnalyzeConfig:
         result = analyze(temp_python_file, config)
         assert isinstance(result, AnalysisResult)
 
+    def test_analyze_with_exclude_patterns(self, temp_directory):
+        """Test that files matching exclude_patterns are skipped."""
+        config = AnalysisConfig(exclude_patterns=["**/util*.py"])
+        result = analyze(temp_directory, config)
+        assert result.file_count == 1
+        assert "helper" not in [s.name for s in result.symbols]
+
+    def test_analyze_with_include_patterns(self, temp_directory):
+        """Test that only files matching include_patterns are analyzed."""
+        os.makedirs(os.path.join(temp_directory, "pkg"))
+        with open(os.path.join(temp_directory, "pkg", "mod.py"), "w") as f:
+            f.write("def in_pkg():\n    pass\n")
+
+        config = AnalysisConfig(include_patterns=["pkg/**"])
+        result = analyze(temp_directory, config)
+        assert result.file_count == 1
+        assert [s.name for s in result.symbols] == ["in_pkg"]
+
+    def test_analyze_skips_large_files(self, temp_directory):
+        """Test that files over max_file_size are skipped with a warning."""
+        with open(os.path.join(temp_directory, "generated.py"), "w") as f:
+            f.write("DATA = " + repr("x" * 1024) + "\n")
+
+        result = analyze(temp_directory, AnalysisConfig(max_file_size=512))
+        assert result.file_count == 2
+        assert result.error_count == 0
+        assert len(result.warnings) == 1
+        assert "generated.py" in result.warnings[0]
+        assert "DATA" not in [s.name for s in result.symbols]
+
+    def test_should_include_patterns(self):
+        """Test glob semantics of AnalysisConfig.should_include()."""
+        config = AnalysisConfig(
+            exclude_patterns=["**/build/**", "*.pyi", "docs/conf.py"],
+            include_patterns=["src/**/*.py", "setup.py"],
+        )
+        assert config.should_include("src/app.py")
+        assert config.should_include("src/pkg/deep/mod.py")
+        assert config.should_include("setup.py")
+        assert not config.should_include("src/build/gen.py")
+        assert not config.should_include("src/pkg/stub.pyi")
+        assert not config.should_include("tests/test_app.py")
+        assert not config.should_include("pkg/setup.py/x")
+
+    def test_patterns_changed_after_construction(self, temp_directory):
+        """Test that edits to the pattern lists apply to later analyses."""
+        os.makedirs(os.path.join(temp_directory, "vendor"))
+        with open(os.path.join(temp_directory, "vendor", "lib.py"), "w") as f:
+            f.write("def vendored():\n    pass\n")
+
+        config = AnalysisConfig()
+        assert analyze(temp_directory, config).file_count == 3
+
+        config.exclude_patterns.append("**/utils.py")
+        config.exclude_patterns.append("**/vendor/**")
+        assert not config.should_include("utils.py")
+        assert analyze(temp_directory, config).file_count == 1
+
+        config.include_patterns = ["vendor/*.py"]
+        config.exclude_patterns = []
+        assert analyze(temp_directory, config).file_count == 1
+        assert "vendored" in [s.name for s in analyze(temp_directory, config).symbols]
+
     def test_analyze_without_config(self, temp_python_file):
         """Test analyze() without explicit config (uses default)."""
         result = analyze(temp_python_file)
@@ -185,12 +431,149 @@ class TestAnalyzeErrors:
         with pytest.raises((TypeError, ValueError)):
             analyze(12345)  # type: ignore
 
+    def test_analyze_directory_with_syntax_error(self, temp_directory):
+        """Test that a broken file is reported without hiding other files."""
+        with open(os.path.join(temp_directory, "broken.py"), "w") as f:
+            f.write("def broken(:\n    pass\n")
+
+        result = analyze(temp_directory)
+        function_names = [
+            s.name for s in result.symbols if s.kind == SymbolKind.FUNCTION
+        ]
+        assert result.error_count == 1
+        assert len(result.warnings) == 1
+        assert "broken.py" in result.warnings[0]
+        assert "main" in function_names
+        assert "helper" in function_names
+
+    def test_analyze_file_with_coding_declaration(self, tmp_path):
+        """Test that non-UTF-8 files with a coding declaration are decoded."""
+        source = tmp_path / "legacy.py"
+        source.write_bytes(
+            b"# -*- coding: latin-1 -*-\ndef legacy():\n    '''Caf\xe9.'''\n"
+        )
+
+        result = analyze(source)
+        assert result.error_count == 0
+        assert [s.docstring for s in result.symbols] == ["Café."]
+
+    def test_analyze_file_with_invalid_encoding(self, tmp_path):
+        """Test that undecodable files are reported as errors."""
+        source = tmp_path / "garbage.py"
+        source.write_bytes(b"x = '\xff\xfe'\n")
+
+        result = analyze(source)
+        assert result.error_count == 1
+        assert result.symbols == []
+
     def test_deep_mode_without_callback(self):
         """Test that Deep Mode requires audit callback."""
         with pytest.raises(ValueError, match="Deep Mode requires audit_callback"):
             _ = AnalysisConfig(enable_deep_mode=True)
 
 
+class TestAnalyzeCache:
+    """Test analyze() symbol caching."""
+
+    def test_cache_creates_database(self, temp_directory, tmp_path):
+        """Test that analyze() creates the cache database in cache_dir."""
+        cache_dir = tmp_path / "cache"
+        analyze(temp_directory, AnalysisConfig(cache_dir=cache_dir))
+        assert (cache_dir / "symbols.sqlite3").exists()
+
+    def test_cache_hit_returns_same_symbols(self, temp_directory, tmp_path):
+        """Test that a warm cache returns the same symbols as a cold run."""
+        config = AnalysisConfig(cache_dir=str(tmp_path))
+        cold = analyze(temp_directory, config)
+        # Force the lookup to go through the database
+        _cache._SYMBOL_CACHE.clear()
+        warm = analyze(temp_directory, config)
+        assert warm.symbols == cold.symbols
+        assert warm.file_count == cold.file_count
+
+    def test_cache_reads_each_file_once(self, temp_directory, tmp_path, monkeypatch):
+        """Test that a cached run reads every file once and parses only misses."""
+        config = AnalysisConfig(cache_dir=tmp_path)
+        analyze(temp_directory, config)
+        _cache._SYMBOL_CACHE.clear()
+        with open(os.path.join(temp_directory, "utils.py"), "w") as f:
+            f.write("def renamed_helper():\n    return 1\n")
+
+        reads = []
+        parsed = []
+        read_bytes = Path.read_bytes
+        iter_symbols = contexta_core._symbols.iter_symbols
+
+        def counting_read_bytes(self):
+            reads.append(str(self))
+            return read_bytes(self)
+
+        def counting_iter_symbols(tree, file_path):
+            parsed.append(file_path.name)
+            return iter_symbols(tree, file_path)
+
+        monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+        monkeypatch.setattr(
+            contexta_core._symbols, "iter_symbols", counting_iter_symbols
+        )
+        result = analyze(temp_directory, config)
+        assert len(reads) == len(set(reads)) == result.file_count
+        assert parsed == ["utils.py"]
+        assert "renamed_helper" in [s.name for s in result.symbols]
+
+    def test_cache_picks_up_changed_file(self, temp_directory, tmp_path):
+        """Test that editing a file invalidates its cache entry."""
+        config = AnalysisConfig(cache_dir=tmp_path)
+        analyze(temp_directory, config)
+
+        with open(os.path.join(temp_directory, "utils.py"), "w") as f:
+            f.write("def renamed_helper():\n    return 1\n")
+
+        result = analyze(temp_directory, config)
+        function_names = [
+            s.name for s in result.symbols if s.kind == SymbolKind.FUNCTION
+        ]
+        assert "renamed_helper" in function_names
+        assert "helper" not in function_names
+
+    def test_reanalysis_reuses_unchanged_files(self, temp_directory):
+        """Test that repeated in-process analyses return equal results."""
+        first = analyze(temp_directory)
+        second = analyze(temp_directory)
+        assert second.symbols == first.symbols
+        assert second.symbols is not first.symbols
+
+    def test_reanalysis_results_are_independent(self, temp_directory):
+        """Test that mutating one result does not leak into later ones."""
+        first = analyze(temp_directory)
+        original = first.symbols[0].name
+        first.symbols[0].name = "MUTATED"
+        first.symbols[0].metadata["x"] = 1
+
+        second = analyze(temp_directory)
+        assert second.symbols[0] is not first.symbols[0]
+        assert second.symbols[0].name == original
+        assert second.symbols[0].metadata == {}
+
+        second.symbols[0].metadata["y"] = 2
+        third = analyze(temp_directory)
+        assert third.symbols[0].metadata == {}
+
+    def test_reanalysis_picks_up_changed_file(self, temp_directory):
+        """Test that the in-memory cache notices edited files."""
+        analyze(temp_directory)
+
+        with open(os.path.join(temp_directory, "utils.py"), "w") as f:
+            f.write("def renamed_helper():\n    return 1\n")
+
+        result = analyze(temp_directory)
+        function_names = [
+            s.name for s in result.symbols if s.kind == SymbolKind.FUNCTION
+        ]
+        assert "renamed_helper" in function_names
+        assert "helper" not in function_names
+
+
 class TestAnalysisResult:
     """Test AnalysisResult structure."""
 
@@ -231,6 +614,30 @@ class TestAnalysisResult:
         assert hasattr(result, "metadata")
         assert isinstance(result.metadata, dict)
 
+    def test_symbol_table_round_trips(self, temp_python_file):
+        """Test that symbol_table() preserves every symbol in order."""
+        result = analyze(temp_python_file)
+        table = result.symbol_table()
+        assert len(table) == len(result.symbols)
+        assert list(table) == result.symbols
+        assert table[-1] == result.symbols[-1]
+        assert table[1:3] == result.symbols[1:3]
+        with pytest.raises(IndexError):
+            table[len(table)]
+
+    def test_symbol_table_filter_by_kind(self, temp_python_file):
+        """Test that filter_by_kind() selects symbols of one kind."""
+        result = analyze(temp_python_file)
+        table = result.symbol_table()
+        expected = [
+            i for i, s in enumerate(result.symbols) if s.kind == SymbolKind.METHOD
+        ]
+        assert expected
+        assert table.filter_by_kind(SymbolKind.METHOD) == expected
+        assert [table.names[i] for i in expected] == [
+            result.symbols[i].name for i in expected
+        ]
+
 
 class TestSymbolStructure:
     """Test Symbol dataclass structure."""
@@ -1,8 +1,10 @@
 // PyO3 Python bindings for Contexta analyzer-core
 // Exposes Rust indexing functionality to Python with async support
 
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::sync::PyOnceLock;
+use pyo3::types::{PyDict, PyString, PyTuple};
 
 mod bridge;
 
@@ -25,29 +27,59 @@ fn analyze(
     Ok(result)
 }
 
-/// Return list of available analyzer capabilities
+/// Capabilities tuple, built on first use and shared by every later call
+static CAPABILITIES: PyOnceLock<Py<PyTuple>> = PyOnceLock::new();
+
+/// Return tuple of available analyzer capabilities
+///
+/// Capabilities are fixed at build time, so the same immutable tuple is
+/// returned on every call instead of allocating a new list.
 #[pyfunction]
-fn capabilities() -> PyResult<Vec<String>> {
-    let mut caps = vec![
-        "analyze".to_string(),
-        "python".to_string(),
-        "typescript".to_string(),
-        "javascript".to_string(),
-        "rust".to_string(),
-    ];
+fn capabilities(py: Python<'_>) -> PyResult<Bound<'_, PyTuple>> {
+    let caps = CAPABILITIES.get_or_try_init(py, || {
+        #[allow(unused_mut)]
+        let mut caps = vec!["analyze", "python", "typescript", "javascript", "rust"];
 
-    #[cfg(feature = "deep-mode")]
-    caps.push("deep-mode".to_string());
+        #[cfg(feature = "deep-mode")]
+        caps.push("deep-mode");
 
-    Ok(caps)
+        // Interned so comparisons against Python string literals, which are
+        // interned too, succeed on the identity fast path
+        let caps = caps.into_iter().map(|cap| PyString::intern(py, cap));
+        PyTuple::new(py, caps).map(Bound::unbind)
+    })?;
+    Ok(caps.bind(py).clone())
 }
 
 /// Check if a client version is compatible with this core version
+///
+/// The version must be exactly `MAJOR.MINOR.PATCH` with ASCII digits only;
+/// anything else (whitespace, pre-release or build suffixes, a `v` prefix)
+/// raises `ValueError`. Only 0.1.x versions are compatible for now.
 #[pyfunction]
 fn check_compatibility(client_version: String) -> PyResult<bool> {
-    // Simple version compatibility check
-    // For now, accept any 0.1.x version
-    Ok(client_version.starts_with("0.1."))
+    if client_version.trim() != client_version {
+        return Err(PyValueError::new_err(format!(
+            "Invalid version string (whitespace): {client_version:?}"
+        )));
+    }
+
+    let parts: Vec<&str> = client_version.split('.').collect();
+    let well_formed = parts.len() == 3
+        && parts
+            .iter()
+            .all(|p| !p.is_empty() && p.bytes().all(|b| b.is_ascii_digit()));
+    if !well_formed {
+        return Err(PyValueError::new_err(format!(
+            "Invalid version string: {client_version:?}"
+        )));
+    }
+
+    // Compare numerically without parsing, so oversized components cannot
+    // overflow: "00" is 0 and "01" is 1.
+    let is_zero = |p: &str| p.bytes().all(|b| b == b'0');
+    let is_one = |p: &str| p.trim_start_matches('0') == "1";
+    Ok(is_zero(parts[0]) && is_one(parts[1]))
 }
 
 /// Initialize the Contexta Python module